@@ -9,41 +9,55 @@ The suite will:
 
 This script creates:
 - test_video_capture.sh  (main test script)
+- test_video_capture_parallel.sh (parallel job-queue variant)
 - monitor_metrics.sh     (helper for system usage logging)
 - summarize_results.py   (Python summarizer)
 - results/               (output logs and videos)
 """
 
 import os
-import stat
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import dedent
 
 # Use current directory instead of hardcoded path
 base_path = os.path.dirname(os.path.abspath(__file__))
 results_path = os.path.join(base_path, "results")
 
-# Create results directory if it doesn't exist
-os.makedirs(results_path, exist_ok=True)
-
-scripts = {
-    "test_video_capture.sh": dedent("""\
+# Shell helper shared by the test scripts and diagnose.sh, kept in one place
+# so the copies cannot drift apart
+_V4L2_FIELD = dedent("""\
+        # Store field $2 (e.g. "Card type") of v4l2-ctl output $3 in variable $1 (no forks)
+        v4l2_field() {
+            local line="${3#*"$2"*:}"
+            [ "$line" = "$3" ] && line=""
+            line="${line%%$'\\n'*}"
+            line="${line#"${line%%[![:space:]]*}"}"
+            printf -v "$1" '%s' "${line%"${line##*[![:space:]]}"}"
+        }
+""")
+
+_TEMPLATE = dedent("""\
         #!/bin/bash
         # Automated test suite for Raspberry Pi 5 HDMI ingest
-
-        set -e  # Exit on any error
+        #
+        # No "set -e": a failing probe or test is expected and handled where it
+        # happens; setup steps that must succeed check their status explicitly.
 
         DURATION=10   # seconds to record
         RES="1920x1080"
         FPS=30
         OUTDIR="./results"
-        mkdir -p "$OUTDIR"
+        if ! mkdir -p "$OUTDIR"; then
+            echo "ERROR: cannot create output directory $OUTDIR"
+            exit 1
+        fi
 
         # Check dependencies
         echo "Checking dependencies..."
-        for cmd in ffmpeg v4l2-ctl iostat; do
+        for cmd in ffmpeg v4l2-ctl; do
             if ! command -v "$cmd" &> /dev/null; then
                 echo "ERROR: $cmd is not installed. Please install it first."
-                echo "Run: sudo apt install ffmpeg v4l-utils sysstat"
+                echo "Run: sudo apt install ffmpeg v4l-utils"
                 exit 1
             fi
         done
@@ -51,15 +65,124 @@ scripts = {
         declare -A FORMATS
         FORMATS["mjpeg"]="mjpeg"
         FORMATS["yuyv"]="yuyv422"
+        FORMATS["nv12"]="nv12"
+
+        # V4L2 fourcc reported by --list-formats-ext for each format
+        declare -A FOURCC
+        FOURCC["mjpeg"]="MJPG"
+        FOURCC["yuyv"]="YUYV"
+        FOURCC["nv12"]="NV12"
+
+        # Reverse lookup, built once: fourcc -> FORMATS key
+        declare -A FORMAT_BY_FOURCC
+        for FMT in "${!FOURCC[@]}"; do
+            FORMAT_BY_FOURCC[${FOURCC[$FMT]}]=$FMT
+        done
+
+        # Hardware H.264 is the primary encode path; libx264 saturates a core at
+        # 1080p30 and is only run as a reference with INCLUDE_SOFTWARE=1
+        INCLUDE_SOFTWARE=${INCLUDE_SOFTWARE:-0}
 
         declare -A ENCODERS
-        ENCODERS["copy"]="-c:v copy"
-        ENCODERS["v4l2m2m"]="-c:v h264_v4l2m2m -b:v 5M"
-        ENCODERS["libx264"]="-c:v libx264 -preset ultrafast -crf 23"
+        ENCODERS["copy"]="-map 0 -c copy"
+        ENCODERS["v4l2m2m"]="-threads 1 -c:v h264_v4l2m2m -b:v 5M -pix_fmt yuv420p"
+        ENCODERS["v4l2m2m_main"]="-threads 1 -c:v h264_v4l2m2m -b:v 5M -pix_fmt yuv420p -profile:v main -level:v 4.0"
+        if [ "$INCLUDE_SOFTWARE" = 1 ]; then
+            ENCODERS["libx264"]="-threads 0 -c:v libx264 -preset ultrafast -tune zerolatency -crf 28"
+        fi
+
+        # DRM-upload variant: hwupload copies each captured frame (on the CPU)
+        # into a DRM dma-buf, which the encoder then imports instead of taking
+        # its own copy of a userspace buffer. This is not zero-copy: ffmpeg's
+        # v4l2 input cannot export capture buffers as dma-bufs, so the copy
+        # moves rather than disappears. Whether hwupload and the encoder accept
+        # DRM frames is checked by encoding a few test frames once, and the test
+        # is left out when that fails (e.g. a stock distro ffmpeg).
+        if timeout 10 ffmpeg -hide_banner -loglevel error -f lavfi -i testsrc=s=64x64:d=0.1 \\
+                -init_hw_device drm=drm -filter_hw_device drm -vf format=nv12,hwupload \\
+                -c:v h264_v4l2m2m -f null - < /dev/null &> /dev/null; then
+            ENCODERS["v4l2m2m_dmabuf"]="-threads 1 -init_hw_device drm=drm -filter_hw_device drm -vf format=nv12,hwupload -c:v h264_v4l2m2m -b:v 5M"
+        fi
+
+        # Drop encoders this ffmpeg build does not have, so their tests are
+        # skipped up front instead of each one failing after ffmpeg starts
+        FFMPEG_ENCODERS=$(ffmpeg -hide_banner -encoders 2>/dev/null)
+        for ENC in "${!ENCODERS[@]}"; do
+            CODEC=${ENCODERS[$ENC]#*-c:v }
+            [ "$CODEC" = "${ENCODERS[$ENC]}" ] && continue  # stream copy
+            CODEC=${CODEC%% *}
+            if [[ $FFMPEG_ENCODERS != *" $CODEC "* ]]; then
+                echo "WARNING: ffmpeg has no $CODEC encoder, skipping $ENC tests"
+                unset "ENCODERS[$ENC]"
+            fi
+        done
+
+        # The h264_v4l2m2m wrapper is listed whenever ffmpeg was built with it,
+        # even where no encoder device exists (a Pi 5 has no H.264 encode
+        # block), so encode a few test frames once and drop the v4l2m2m tests
+        # when that fails
+        if [ -n "${ENCODERS[v4l2m2m]}" ] && ! timeout 10 ffmpeg -hide_banner -loglevel error -f lavfi -i testsrc=s=64x64:d=0.1 \\
+                -pix_fmt yuv420p -c:v h264_v4l2m2m -f null - < /dev/null &> /dev/null; then
+            echo "WARNING: h264_v4l2m2m cannot encode on this system, skipping v4l2m2m tests"
+            for ENC in "${!ENCODERS[@]}"; do
+                [[ $ENC == v4l2m2m* ]] && unset "ENCODERS[$ENC]"
+            done
+        fi
+
+        # libx264 is opt-in, so without the hardware encoder nothing is encoded
+        if [ -z "${ENCODERS[v4l2m2m]}${ENCODERS[libx264]}" ]; then
+            echo "WARNING: no H.264 encoder available, only stream copy tests will run"
+            [ "$INCLUDE_SOFTWARE" = 1 ] || echo "Run with INCLUDE_SOFTWARE=1 to test libx264 instead"
+        fi
 
-        # Detect video devices
+        # Capture-side options shared by every test. -thread_queue_size only
+        # applies to the input when given before -i; the deeper queue keeps the
+        # V4L2 reader from dropping frames while a slow encoder catches up.
+        INPUT_OPTS="-thread_queue_size 512 -f v4l2 -framerate $FPS -video_size $RES"
+
+        # Output container per encoder (default mp4); stream copy only makes
+        # sense for MJPEG, which Matroska carries natively
+        declare -A CONTAINER
+        CONTAINER["copy"]="mkv"
+
+        # Curated format:encoder matrix. Passthrough only needs one compressed
+        # format and each encoder only needs one representative raw format, so
+        # the full FORMATS x ENCODERS product would mostly re-measure the same
+        # capture path.
+        TESTS=(
+            "mjpeg:copy"
+            "mjpeg:v4l2m2m"
+            "yuyv:v4l2m2m"
+            "nv12:v4l2m2m"
+            "nv12:v4l2m2m_main"
+            "nv12:v4l2m2m_dmabuf"
+            "nv12:libx264"
+        )
+
+        {V4L2_FIELD}
+
+        # Store byte count $2 as a short human-readable size (e.g. 12M) in variable $1
+        human_size() {
+            if (( $2 >= 1048576 )); then
+                printf -v "$1" '%dM' $(( $2 / 1048576 ))
+            elif (( $2 >= 1024 )); then
+                printf -v "$1" '%dK' $(( $2 / 1024 ))
+            else
+                printf -v "$1" '%dB' "$2"
+            fi
+        }
+
+        # Detect video devices: one --list-devices call, keeping only the first
+        # /dev/videoN of each card whose name/bus matches DEVICE_FILTER (the
+        # remaining nodes of a UVC card are metadata, and platform blocks such
+        # as the ISP or codecs are not capture inputs)
+        DEVICE_FILTER=${DEVICE_FILTER:-usb|hdmi}
         echo "Detecting video devices..."
-        VDEVICES=($(v4l2-ctl --list-devices 2>/dev/null | grep -E '/dev/video[0-9]+' | awk '{print $1}' || true))
+
+        mapfile -t VDEVICES < <(v4l2-ctl --list-devices 2>/dev/null | awk -v filter="$DEVICE_FILTER" '
+            /^[^[:space:]]/ { card = tolower($0); first = 1; next }
+            first && $1 ~ "^/dev/video[0-9]+$" { first = 0; if (card ~ filter) print $1 }
+        ')
 
         if [ ${#VDEVICES[@]} -eq 0 ]; then
             echo "ERROR: No video devices found!"
@@ -75,72 +198,291 @@ scripts = {
 
         echo "Found video devices: ${VDEVICES[*]}"
 
-        # Test each device's capabilities first
+        # Query each device once: a single v4l2-ctl run prints the --all report
+        # and the format listing, and everything below reads from this cache.
+        # DEV_SUPPORTED["$VDEV:$FMT"] is set for every FORMATS key the device offers.
+        declare -A DEV_ALL DEV_FOURCCS DEV_SUPPORTED
         for VDEV in "${VDEVICES[@]}"; do
-            echo "Testing capabilities for $VDEV..."
-            if ! v4l2-ctl -d "$VDEV" --list-formats-ext &>/dev/null; then
-                echo "WARNING: Cannot access $VDEV, skipping..."
+            DEV_ALL[$VDEV]=$(v4l2-ctl -d "$VDEV" --all --list-formats-ext 2>/dev/null)
+
+            # Collect fourccs from the cached listing in-process; format lines
+            # look like "[0]: 'MJPG' (Motion-JPEG, compressed)"
+            DEV_FOURCCS[$VDEV]=""
+            while IFS= read -r LINE; do
+                [[ $LINE == *"]: '"* ]] || continue
+                CC=${LINE#*"'"}
+                CC=${CC%%"'"*}
+                [[ " ${DEV_FOURCCS[$VDEV]} " == *" $CC "* ]] && continue
+                DEV_FOURCCS[$VDEV]+="${DEV_FOURCCS[$VDEV]:+ }$CC"
+                FMT=${FORMAT_BY_FOURCC[$CC]}
+                if [ -n "$FMT" ]; then
+                    DEV_SUPPORTED["$VDEV:$FMT"]=1
+                fi
+            done <<<"${DEV_ALL[$VDEV]}"
+        done
+
+        # Metrics sampler runs as a function in this shell rather than a new bash
+        if ! source ./monitor_metrics.sh; then
+            echo "ERROR: ./monitor_metrics.sh not found; run from the test suite directory"
+            exit 1
+        fi
+        # Find the disk under OUTDIR now, so no sampler runs stat/findmnt mid-test
+        resolve_disk "$OUTDIR"
+
+        # Per-run scratch directory for lock files
+        LOCK_DIR=$(mktemp -d) || exit 1
+        trap 'rm -rf "$LOCK_DIR"' EXIT
+
+        # The Pi has a single hardware H.264 encoder, so tests that may run at
+        # the same time (devices in parallel, or the parallel job queue) take
+        # turns on it. encoder_lock $1 blocks until the encoder is free when
+        # encoder $1 is a v4l2m2m variant; encoder_unlock releases it.
+        ENC_LOCK_FD=""
+        encoder_lock() {
+          [[ $1 == v4l2m2m* ]] || return 0
+          exec {ENC_LOCK_FD}>"$LOCK_DIR/v4l2m2m.lock"
+          flock "$ENC_LOCK_FD"
+        }
+        encoder_unlock() {
+          [ -n "$ENC_LOCK_FD" ] || return 0
+          exec {ENC_LOCK_FD}>&-
+          ENC_LOCK_FD=""
+        }
+
+        {DISPATCH}
+""")
+
+_SERIAL_DISPATCH = dedent("""\
+        # Devices are tested one at a time by default, so the system-wide CPU
+        # and disk figures in each log belong to a single test. PARALLEL_DEVICES=1
+        # gives each device its own background job: quicker when several software
+        # or copy tests are enabled, but every log then includes the other
+        # devices' ffmpeg, and v4l2m2m tests still take turns on the encoder.
+        PARALLEL_DEVICES=${PARALLEL_DEVICES:-0}
+
+        # SHARED_CAPTURE=1 captures each format once and feeds all of its
+        # encoders from that one ffmpeg (one output file per encoder). This saves
+        # a device open and DURATION seconds per extra encoder, but the metrics
+        # log then covers the whole group, and one failing encoder fails the group.
+        SHARED_CAPTURE=${SHARED_CAPTURE:-0}
+
+        # One timestamp per run; the test number keeps file names unique
+        printf -v START_TS '%(%Y%m%d_%H%M%S)T' -1
+        COUNTS_DIR="$LOCK_DIR/counts"
+        mkdir "$COUNTS_DIR" || exit 1
+
+        # Let device $1 settle only if ffmpeg actually streamed from it (started at
+        # $2); an immediate failure (bad format/encoder) has nothing to release.
+        # Poll until no process holds the node (at most 2 s) rather than
+        # always pausing; without fuser, fall back to the fixed 2 s.
+        settle_device() {
+          if (( EPOCHSECONDS - $2 >= 2 )); then
+              if command -v fuser &> /dev/null; then
+                  for _ in {1..20}; do
+                      fuser -s "$1" || break
+                      sleep 0.1
+                  done
+                  sleep 0.2
+              else
+                  sleep 2
+              fi
+          fi
+        }
+
+        # Run every format/encoder combination on one device and record its
+        # "total successful" counts in $COUNTS_DIR for the final summary
+        run_device_tests() {
+          local VDEV=$1
+          local DEV_BASENAME="${VDEV##*/}"
+          local TOTAL_TESTS=0 SUCCESSFUL_TESTS=0
+          local TEST FMT ENC TS OUTFILE LOGFILE MONITOR_PID DEVICE_NAME OUT_BYTES FILE_SIZE TEST_START
+
+          # Skip if device not accessible
+          if [ -z "${DEV_ALL[$VDEV]}" ]; then
+              echo "Skipping inaccessible device: $VDEV"
+              return
+          fi
+
+          v4l2_field DEVICE_NAME "Card type" "${DEV_ALL[$VDEV]}"
+          echo "$VDEV (${DEVICE_NAME:-unknown}) supported formats: ${DEV_FOURCCS[$VDEV]:-none}"
+
+          for TEST in "${TESTS[@]}"; do
+            FMT="${TEST%%:*}"
+            ENC="${TEST#*:}"
+            # Encoder not enabled for this run (e.g. libx264 without INCLUDE_SOFTWARE=1)
+            [ -n "${ENCODERS[$ENC]}" ] || continue
+
+            # Test if format is supported; skipped tests are not counted and
+            # start no monitor and no settle wait
+            if [ -z "${DEV_SUPPORTED[$VDEV:$FMT]}" ]; then
+                echo "WARNING: Format ${FORMATS[$FMT]} not supported by $VDEV, skipping $ENC..."
                 continue
             fi
+
+            TOTAL_TESTS=$((TOTAL_TESTS + 1))
+            TS="${START_TS}_${TOTAL_TESTS}"
+            OUTFILE="${OUTDIR}/${DEV_BASENAME}_${FMT}_${ENC}_${TS}.${CONTAINER[$ENC]:-mp4}"
+            LOGFILE="${OUTDIR}/${DEV_BASENAME}_${FMT}_${ENC}_${TS}.log"
             
-            echo "Supported formats for $VDEV:"
-            v4l2-ctl -d "$VDEV" --list-formats-ext | head -20
-        done
+            echo "[$DEV_BASENAME #$TOTAL_TESTS] Recording $VDEV at $RES $FPS using ${FORMATS[$FMT]} -> $ENC..."
+            
+            # Wait for the hardware encoder before the monitor starts, so
+            # time spent queued is not sampled as part of this test
+            encoder_lock "$ENC"
 
-        # Make monitor script executable
-        chmod +x ./monitor_metrics.sh 2>/dev/null || true
+            # Start monitoring in background
+            sample_metrics "$DURATION" "$OUTDIR" > "$LOGFILE" &
+            MONITOR_PID=$!
+            
+            # Run ffmpeg with error handling
+            TEST_START=$EPOCHSECONDS
+            if timeout $((DURATION + 10)) ffmpeg -y $INPUT_OPTS -input_format ${FORMATS[$FMT]} -i $VDEV ${ENCODERS[$ENC]} -t $DURATION "$OUTFILE" < /dev/null 2>"${OUTFILE}.error.log"; then
+                OUT_BYTES=$(stat -c %s "$OUTFILE" 2>/dev/null)
+                human_size FILE_SIZE "${OUT_BYTES:-0}"
+                echo "OK SUCCESS: $OUTFILE created ($FILE_SIZE)"
+                SUCCESSFUL_TESTS=$((SUCCESSFUL_TESTS + 1))
+                # Remove error log if successful
+                rm -f "${OUTFILE}.error.log"
+            else
+                echo "X FAILED: Check ${OUTFILE}.error.log for details"
+            fi
+            
+            # Stop monitoring
+            kill "$MONITOR_PID" 2>/dev/null
+            encoder_unlock
+            
+            settle_device "$VDEV" "$TEST_START"
+          done
 
-        TOTAL_TESTS=0
-        SUCCESSFUL_TESTS=0
+          echo "$TOTAL_TESTS $SUCCESSFUL_TESTS" > "$COUNTS_DIR/$DEV_BASENAME"
+        }
+
+        # Record device $1 in format $2 with one ffmpeg and one output per
+        # encoder $3...; adds to the caller's TOTAL_TESTS and SUCCESSFUL_TESTS
+        run_shared_group() {
+          local VDEV=$1 FMT=$2
+          shift 2
+          local DEV_BASENAME="${VDEV##*/}"
+          local ENC HW_ENC="" OUTFILE LOGFILE MONITOR_PID OUT_BYTES FILE_SIZE TEST_START
+          local OUTPUTS=() OUTPUT_ARGS=()
+
+          for ENC in "$@"; do
+            [[ $ENC == v4l2m2m* ]] && HW_ENC=$ENC
+            TOTAL_TESTS=$((TOTAL_TESTS + 1))
+            OUTFILE="${OUTDIR}/${DEV_BASENAME}_${FMT}_${ENC}_${START_TS}_${TOTAL_TESTS}.${CONTAINER[$ENC]:-mp4}"
+            OUTPUTS+=("$OUTFILE")
+            OUTPUT_ARGS+=(${ENCODERS[$ENC]} -t "$DURATION" "$OUTFILE")
+          done
 
-        for VDEV in "${VDEVICES[@]}"; do
-          # Skip if device not accessible
-          if ! v4l2-ctl -d "$VDEV" --list-formats-ext &>/dev/null; then
+          LOGFILE="${OUTDIR}/${DEV_BASENAME}_${FMT}_shared_${START_TS}_${TOTAL_TESTS}.log"
+          echo "[$DEV_BASENAME] Recording $VDEV at $RES $FPS using ${FORMATS[$FMT]} -> ${#OUTPUTS[@]} output(s) from one capture..."
+
+          # The log is named after the group, so list its outputs next to it for
+          # the summarizers to report each one with the group's metrics
+          printf '%s\\n' "${OUTPUTS[@]##*/}" > "${LOGFILE%.log}.outputs"
+
+          # The group holds the hardware encoder if one of its outputs uses it
+          encoder_lock "$HW_ENC"
+
+          sample_metrics "$DURATION" "$OUTDIR" > "$LOGFILE" &
+          MONITOR_PID=$!
+
+          TEST_START=$EPOCHSECONDS
+          if timeout $((DURATION + 10)) ffmpeg -y $INPUT_OPTS -input_format ${FORMATS[$FMT]} -i $VDEV "${OUTPUT_ARGS[@]}" < /dev/null 2>"${LOGFILE%.log}.error.log"; then
+              for OUTFILE in "${OUTPUTS[@]}"; do
+                  OUT_BYTES=$(stat -c %s "$OUTFILE" 2>/dev/null)
+                  human_size FILE_SIZE "${OUT_BYTES:-0}"
+                  echo "OK SUCCESS: $OUTFILE created ($FILE_SIZE)"
+              done
+              SUCCESSFUL_TESTS=$((SUCCESSFUL_TESTS + ${#OUTPUTS[@]}))
+              rm -f "${LOGFILE%.log}.error.log"
+          else
+              echo "X FAILED: Check ${LOGFILE%.log}.error.log for details"
+          fi
+
+          kill "$MONITOR_PID" 2>/dev/null
+          encoder_unlock
+          settle_device "$VDEV" "$TEST_START"
+        }
+
+        # SHARED_CAPTURE variant of run_device_tests: one ffmpeg per format, with
+        # one output per enabled encoder of that format in TESTS. The Pi has one
+        # hardware encoder, so a group carries at most one v4l2m2m output and
+        # each further v4l2m2m variant is recorded by its own capture.
+        run_device_shared() {
+          local VDEV=$1
+          local DEV_BASENAME="${VDEV##*/}"
+          local TOTAL_TESTS=0 SUCCESSFUL_TESTS=0
+          local TEST FMT ENC DEVICE_NAME
+          local FMTS=() GROUP=() SOLO=()
+
+          if [ -z "${DEV_ALL[$VDEV]}" ]; then
               echo "Skipping inaccessible device: $VDEV"
-              continue
+              return
           fi
 
-          for FMT in "${!FORMATS[@]}"; do
-            for ENC in "${!ENCODERS[@]}"; do
-              TOTAL_TESTS=$((TOTAL_TESTS + 1))
-              TS=$(date +%Y%m%d_%H%M%S)
-              OUTFILE="${OUTDIR}/$(basename $VDEV)_${FMT}_${ENC}_${TS}.mp4"
-              LOGFILE="${OUTDIR}/$(basename $VDEV)_${FMT}_${ENC}_${TS}.log"
-              
-              echo "[$TOTAL_TESTS] Recording $VDEV at $RES $FPS using ${FORMATS[$FMT]} -> $ENC..."
-              
-              # Start monitoring in background
-              if [ -x "./monitor_metrics.sh" ]; then
-                  ./monitor_metrics.sh "$DURATION" "$LOGFILE" &
-                  MONITOR_PID=$!
-              else
-                  echo "Warning: monitor_metrics.sh not executable, skipping monitoring"
-                  MONITOR_PID=""
-              fi
-              
-              # Test if format is supported
-              if ! v4l2-ctl -d "$VDEV" --list-formats-ext | grep -q "${FORMATS[$FMT]}"; then
-                  echo "WARNING: Format ${FORMATS[$FMT]} not supported by $VDEV, skipping..."
-                  [ -n "$MONITOR_PID" ] && kill "$MONITOR_PID" 2>/dev/null || true
-                  continue
-              fi
-              
-              # Run ffmpeg with error handling
-              if timeout $((DURATION + 10)) ffmpeg -y -f v4l2 -framerate $FPS -video_size $RES -input_format ${FORMATS[$FMT]} -i $VDEV ${ENCODERS[$ENC]} -t $DURATION "$OUTFILE" < /dev/null 2>"${OUTFILE}.error.log"; then
-                  echo "OK SUCCESS: $OUTFILE created"
-                  SUCCESSFUL_TESTS=$((SUCCESSFUL_TESTS + 1))
-                  # Remove error log if successful
-                  rm -f "${OUTFILE}.error.log"
+          v4l2_field DEVICE_NAME "Card type" "${DEV_ALL[$VDEV]}"
+          echo "$VDEV (${DEVICE_NAME:-unknown}) supported formats: ${DEV_FOURCCS[$VDEV]:-none}"
+
+          # Formats in the order they first appear in TESTS
+          for TEST in "${TESTS[@]}"; do
+            [[ " ${FMTS[*]} " == *" ${TEST%%:*} "* ]] || FMTS+=("${TEST%%:*}")
+          done
+
+          for FMT in "${FMTS[@]}"; do
+            if [ -z "${DEV_SUPPORTED[$VDEV:$FMT]}" ]; then
+                echo "WARNING: Format ${FORMATS[$FMT]} not supported by $VDEV, skipping..."
+                continue
+            fi
+
+            GROUP=()
+            SOLO=()
+            for TEST in "${TESTS[@]}"; do
+              [ "${TEST%%:*}" = "$FMT" ] || continue
+              ENC="${TEST#*:}"
+              [ -n "${ENCODERS[$ENC]}" ] || continue
+              if [[ $ENC == v4l2m2m* && " ${GROUP[*]}" == *" v4l2m2m"* ]]; then
+                  SOLO+=("$ENC")
               else
-                  echo "X FAILED: Check ${OUTFILE}.error.log for details"
+                  GROUP+=("$ENC")
               fi
-              
-              # Stop monitoring
-              [ -n "$MONITOR_PID" ] && kill "$MONITOR_PID" 2>/dev/null || true
-              
-              sleep 2
+            done
+            [ ${#GROUP[@]} -gt 0 ] || continue
+
+            run_shared_group "$VDEV" "$FMT" "${GROUP[@]}"
+            for ENC in "${SOLO[@]}"; do
+              run_shared_group "$VDEV" "$FMT" "$ENC"
             done
           done
+
+          echo "$TOTAL_TESTS $SUCCESSFUL_TESTS" > "$COUNTS_DIR/$DEV_BASENAME"
+        }
+
+        RUNNER=run_device_tests
+        if [ "$SHARED_CAPTURE" = 1 ]; then
+            RUNNER=run_device_shared
+        fi
+
+        DEVICE_PIDS=()
+        for VDEV in "${VDEVICES[@]}"; do
+          if [ "$PARALLEL_DEVICES" = 1 ] && [ ${#VDEVICES[@]} -gt 1 ]; then
+              "$RUNNER" "$VDEV" &
+              DEVICE_PIDS+=($!)
+          else
+              "$RUNNER" "$VDEV"
+          fi
+        done
+        for pid in "${DEVICE_PIDS[@]}"; do
+          wait "$pid"
+        done
+
+        TOTAL_TESTS=0
+        SUCCESSFUL_TESTS=0
+        for COUNTS in "$COUNTS_DIR"/*; do
+          [ -f "$COUNTS" ] || continue
+          read -r DEV_TOTAL DEV_SUCCESSFUL < "$COUNTS"
+          TOTAL_TESTS=$((TOTAL_TESTS + DEV_TOTAL))
+          SUCCESSFUL_TESTS=$((SUCCESSFUL_TESTS + DEV_SUCCESSFUL))
         done
 
         echo ""
@@ -153,97 +495,291 @@ scripts = {
         echo ""
         echo "Results saved to: $OUTDIR"
         echo "Run 'python3 summarize_results.py' for analysis."
-    """),
+""")
+
+_PARALLEL_DISPATCH = dedent("""\
+        # Parallel variant: every (device x test) pair is queued as its own job.
+        # Bounded work queue: at most MAX_JOBS jobs run at once, and each job
+        # starts as soon as the resources it needs are free. A capture node can
+        # only be streamed by one ffmpeg, and the Pi has a single hardware H.264
+        # encoder, so those are held with flock for the duration of a job.
+        MAX_JOBS=${MAX_JOBS:-$(nproc)}
+
+        # Runs in a background subshell; its locks are released when it exits
+        run_job() {
+          local VDEV=$1 FMT=$2 ENC=$3 OUTFILE=$4 LOGFILE=$5
+          local DEV_LOCK MPID
+
+          exec {DEV_LOCK}>"$LOCK_DIR/${VDEV##*/}.lock"
+          flock "$DEV_LOCK"
+          encoder_lock "$ENC"
+
+          echo "Starting job for $VDEV at $RES $FPS using ${FORMATS[$FMT]} -> $ENC"
+          sample_metrics "$DURATION" "$OUTDIR" > "$LOGFILE" &
+          MPID=$!
+          if timeout $((DURATION + 10)) ffmpeg -y $INPUT_OPTS -input_format ${FORMATS[$FMT]} -i $VDEV ${ENCODERS[$ENC]} -t $DURATION "$OUTFILE" < /dev/null 2>"${OUTFILE}.error.log"; then
+            echo "OK SUCCESS: $OUTFILE created"
+            rm -f "${OUTFILE}.error.log"
+          else
+            echo "X FAILED: Check ${OUTFILE}.error.log for details"
+          fi
+          kill "$MPID" 2>/dev/null
+        }
+
+        printf -v START_TS '%(%Y%m%d_%H%M%S)T' -1
+        JOB_ID=0
+        RUNNING=0
+
+        # Devices innermost, so queued jobs alternate between devices instead of
+        # filling every slot with jobs waiting on the same device lock
+        for TEST in "${TESTS[@]}"; do
+          FMT="${TEST%%:*}"
+          ENC="${TEST#*:}"
+          [ -n "${ENCODERS[$ENC]}" ] || continue
+          for VDEV in "${VDEVICES[@]}"; do
+            [ -n "${DEV_SUPPORTED[$VDEV:$FMT]}" ] || continue
+            DEV_BASENAME="${VDEV##*/}"
+            JOB_ID=$((JOB_ID + 1))
+            TS="${START_TS}_${JOB_ID}"
+            OUTFILE="${OUTDIR}/${DEV_BASENAME}_${FMT}_${ENC}_${TS}.${CONTAINER[$ENC]:-mp4}"
+            LOGFILE="${OUTDIR}/${DEV_BASENAME}_${FMT}_${ENC}_${TS}.log"
+
+            # Wait for a free slot before queueing the next job
+            if [ "$RUNNING" -ge "$MAX_JOBS" ]; then
+              wait -n
+              RUNNING=$((RUNNING - 1))
+            fi
+            run_job "$VDEV" "$FMT" "$ENC" "$OUTFILE" "$LOGFILE" &
+            RUNNING=$((RUNNING + 1))
+          done
+        done
+
+        # Wait for the remaining jobs to finish
+        wait
+
+        echo "All parallel tests completed. Run 'python3 summarize_results.py' for analysis."
+""")
+
+# Both variants share the configuration, device detection and probing above
+# and differ only in how the tests are dispatched
+_TEMPLATE = _TEMPLATE.replace("{V4L2_FIELD}\n", _V4L2_FIELD)
+SERIAL = _TEMPLATE.replace("{DISPATCH}\n", _SERIAL_DISPATCH)
+PARALLEL = _TEMPLATE.replace("{DISPATCH}\n", _PARALLEL_DISPATCH)
+
+scripts = {
+    "test_video_capture.sh": SERIAL,
+    "test_video_capture_parallel.sh": PARALLEL,
 
     "monitor_metrics.sh": dedent("""\
         #!/bin/bash
         # Usage: ./monitor_metrics.sh duration output.log
+        #    or: source ./monitor_metrics.sh; sample_metrics duration dir > output.log
+        # Samples /proc/stat, /proc/meminfo and /proc/diskstats directly so the
+        # monitor does not fork helper processes while ffmpeg is being measured.
+
+        # Aggregate "cpu" line: idle = idle + iowait, total = user..steal
+        read_cpu() {
+            local label user nice system idle iowait irq softirq steal rest
+            read -r label user nice system idle iowait irq softirq steal rest < /proc/stat
+            CPU_IDLE=$((idle + iowait))
+            CPU_TOTAL=$((user + nice + system + idle + iowait + irq + softirq + steal))
+        }
+
+        # Used memory in MB (MemTotal - MemAvailable)
+        read_mem() {
+            local key value unit total=0
+            while read -r key value unit; do
+                case "$key" in
+                    MemTotal:) total=$value ;;
+                    MemAvailable:) MEM=$(( (total - value) / 1024 )); return ;;
+                esac
+            done < /proc/meminfo
+            MEM=0
+        }
+
+        # Sectors written (field 10) for the device DISK_MAJOR:DISK_MINOR, or
+        # DISK_NAME when st_dev is not a block device (btrfs subvolumes). Paths
+        # on overlayfs or tmpfs have no backing disk and always read 0.
+        read_disk() {
+            local major minor name f4 f5 f6 f7 f8 f9 sectors rest
+            while read -r major minor name f4 f5 f6 f7 f8 f9 sectors rest; do
+                if { [ "$major" = "$DISK_MAJOR" ] && [ "$minor" = "$DISK_MINOR" ]; } || [ "$name" = "$DISK_NAME" ]; then
+                    DISK_SECTORS=$sectors
+                    return
+                fi
+            done < /proc/diskstats
+            DISK_SECTORS=0
+        }
+
+        # Look up the block device backing path $1 for read_disk. This runs stat
+        # and findmnt, so callers resolve their output directory once up front
+        # and sample_metrics only repeats it for a path it has not seen.
+        resolve_disk() {
+            DISK_TARGET=$1
+            read -r DISK_MAJOR DISK_MINOR < <(stat -c '%Hd %Ld' "$1" 2>/dev/null)
+            # --nofsroot drops the "[/subvol]" suffix of btrfs and bind mounts
+            DISK_NAME=$(findmnt -nvo SOURCE --target "$1" 2>/dev/null)
+            DISK_NAME=${DISK_NAME##*/}
+        }
+
+        # Print one CSV row per second for $1 seconds; disk writes are reported
+        # for the block device backing path $2
+        sample_metrics() {
+            local DURATION=$1 TARGET=${2:-.}
+            local END TS CPU CPU_TENTHS DISK TOTAL_DELTA IDLE_DELTA
+            local PREV_IDLE PREV_TOTAL PREV_SECTORS PREV_US NOW_US ROWS=""
+
+            [ "$DISK_TARGET" = "$TARGET" ] || resolve_disk "$TARGET"
+
+            echo "timestamp,cpu_percent,mem_used_mb,disk_write_kbps"
+
+            # Rows are kept in memory and written in one go, so the log file
+            # sees no writes of its own while disk throughput is measured; a
+            # TERM from the runner (ffmpeg finished first) or Ctrl-C still flushes them
+            trap 'printf "%s" "$ROWS"; exit 0' TERM INT
+
+            read_cpu
+            read_disk
+            PREV_IDLE=$CPU_IDLE
+            PREV_TOTAL=$CPU_TOTAL
+            PREV_SECTORS=$DISK_SECTORS
+            PREV_US=${EPOCHREALTIME//[!0-9]/}
+
+            END=$((SECONDS+DURATION))
+            while [ $SECONDS -lt $END ]; do
+              read -r -t 1 -u "$TICK_FD" _
+              TS=$EPOCHSECONDS
+
+              read_cpu
+              read_mem
+              read_disk
+              NOW_US=${EPOCHREALTIME//[!0-9]/}
+
+              # CPU usage in tenths of a percent over the last interval, rounded
+              TOTAL_DELTA=$((CPU_TOTAL - PREV_TOTAL))
+              IDLE_DELTA=$((CPU_IDLE - PREV_IDLE))
+              if [ $TOTAL_DELTA -gt 0 ]; then
+                  CPU_TENTHS=$(( (1000 * (TOTAL_DELTA - IDLE_DELTA) + TOTAL_DELTA / 2) / TOTAL_DELTA ))
+              else
+                  CPU_TENTHS=0
+              fi
+              CPU="$((CPU_TENTHS / 10)).$((CPU_TENTHS % 10))"
 
-        if [ $# -ne 2 ]; then
-            echo "Usage: $0 <duration_seconds> <output_file>"
-            exit 1
-        fi
+              # 512-byte sectors written since the previous sample -> KB/s,
+              # over the measured interval since a tick runs slightly over 1 s
+              if [ $NOW_US -gt $PREV_US ]; then
+                  DISK=$(( (DISK_SECTORS - PREV_SECTORS) * 500000 / (NOW_US - PREV_US) ))
+              else
+                  DISK=0
+              fi
 
-        DURATION=$1
-        OUTFILE=$2
+              PREV_IDLE=$CPU_IDLE
+              PREV_TOTAL=$CPU_TOTAL
+              PREV_SECTORS=$DISK_SECTORS
+              PREV_US=$NOW_US
 
-        # Check if required tools are available
-        if ! command -v iostat &> /dev/null; then
-            echo "Warning: iostat not found, disk metrics will be 0"
-            IOSTAT_AVAILABLE=false
-        else
-            IOSTAT_AVAILABLE=true
-        fi
+              ROWS+="$TS,$CPU,$MEM,$DISK"$'\\n'
+            done
 
-        echo "timestamp,cpu_percent,mem_used_mb,disk_write_kbps" > "$OUTFILE"
-
-        END=$((SECONDS+DURATION))
-        while [ $SECONDS -lt $END ]; do
-          TS=$(date +%s)
-          
-          # Get CPU usage (fallback method if top format differs)
-          CPU=$(top -bn1 | grep -E "Cpu\\(s\\)|%Cpu" | head -1 | awk '{for(i=1;i<=NF;i++) if($i ~ /[0-9.]+%.*id/) {sub(/%.*/, "", $i); print 100-$i; break}}' || echo "0")
-          
-          # Get memory usage
-          MEM=$(free -m | awk '/^Mem:/ {print $3}' || echo "0")
-          
-          # Get disk write speed
-          if [ "$IOSTAT_AVAILABLE" = true ]; then
-              # Try different iostat formats
-              DISK=$(iostat -d 1 2 2>/dev/null | awk 'END {for(i=1;i<=NF;i++) if($i ~ /[0-9.]+/ && $(i-1) ~ /w/) {print $i; exit}} END {print "0"}' || echo "0")
-          else
-              DISK=0
-          fi
-          
-          # Ensure we have numeric values
-          CPU=${CPU:-0}
-          MEM=${MEM:-0}
-          DISK=${DISK:-0}
-          
-          echo "$TS,$CPU,$MEM,$DISK" >> "$OUTFILE"
-          sleep 1
-        done
+            trap - TERM INT
+            printf '%s' "$ROWS"
+        }
+
+        # A pipe nobody writes to: "read -t 1" on it is a 1 s wait that, unlike
+        # sleep, does not fork a process every sample. It is opened once here,
+        # when the file is sourced, and shared by every sampler.
+        DISK_TARGET=""
+        exec {TICK_FD}<> <(:)
+
+        # Standalone use; when sourced, nothing below runs
+        if [ "${BASH_SOURCE[0]}" = "$0" ]; then
+            if [ $# -ne 2 ]; then
+                echo "Usage: $0 <duration_seconds> <output_file>"
+                exit 1
+            fi
+            sample_metrics "$1" "$(dirname "$2")" > "$2"
+        fi
     """),
 
     "summarize_results.py": dedent("""\
-        #!/usr/bin/env python3
+        #!/usr/bin/env -S python3 -S
+        import csv
         import os
-        import pandas as pd
-        from glob import glob
+        import sys
 
         result_dir = "./results"
-        logs = glob(os.path.join(result_dir, "*.log"))
+
+        # One directory read; the entries also answer the video lookups below,
+        # so no per-file exists()/getsize() path lookups are needed
+        try:
+            with os.scandir(result_dir) as it:
+                entries = {e.name: e for e in it}
+        except FileNotFoundError:
+            entries = {}
+
+        logs = [e for name, e in entries.items()
+                if name.endswith(".log") and not name.endswith(".error.log")]
 
         if not logs:
             print("No log files found in results directory.")
-            exit(1)
+            sys.exit(1)
 
         summary = []
 
-        for log_file in logs:
+        for log in logs:
+            log_file = log.path
             try:
-                df = pd.read_csv(log_file)
-                avg_cpu = df['cpu_percent'].mean()
-                max_mem = df['mem_used_mb'].max()
-                avg_disk = df['disk_write_kbps'].mean()
-
-                video_file = log_file.replace(".log", ".mp4")
-                size_mb = os.path.getsize(video_file) / (1024 * 1024) if os.path.exists(video_file) else 0
-
-                summary.append({
-                    "test": os.path.basename(log_file).replace(".log", ""),
-                    "avg_cpu_percent": round(avg_cpu, 1),
-                    "max_mem_mb": max_mem,
-                    "avg_disk_kbps": round(avg_disk, 1),
-                    "video_size_mb": round(size_mb, 2)
-                })
+                # Single streaming pass per log: running sums, no DataFrame
+                with open(log_file, newline="") as f:
+                    reader = csv.reader(f)
+                    header = next(reader)
+                    cpu_col = header.index("cpu_percent")
+                    mem_col = header.index("mem_used_mb")
+                    disk_col = header.index("disk_write_kbps")
+
+                    cpu_sum = 0.0
+                    disk_sum = 0.0
+                    max_mem = 0
+                    samples = 0
+                    for row in reader:
+                        cpu_sum += float(row[cpu_col])
+                        disk_sum += float(row[disk_col])
+                        max_mem = max(max_mem, int(float(row[mem_col])))
+                        samples += 1
+
+                if samples == 0:
+                    raise ValueError("no samples recorded")
+
+                # A SHARED_CAPTURE log covers every output listed in its
+                # .outputs file; each output gets a row with the group's metrics
+                stem = log.name[:-4]
+                outputs = entries.get(stem + ".outputs")
+                if outputs is not None:
+                    with open(outputs.path) as f:
+                        videos = [(name.rsplit(".", 1)[0] + " (shared)", entries.get(name))
+                                  for name in f.read().split()]
+                else:
+                    videos = [(stem, entries.get(stem + ".mp4") or entries.get(stem + ".mkv"))]
+
+                for test, video in videos:
+                    size_mb = video.stat().st_size / (1024 * 1024) if video else 0
+                    summary.append({
+                        "test": test,
+                        "avg_cpu_percent": round(cpu_sum / samples, 1),
+                        "max_mem_mb": max_mem,
+                        "avg_disk_kbps": round(disk_sum / samples, 1),
+                        "video_size_mb": round(size_mb, 2)
+                    })
             except Exception as e:
                 print(f"Error processing {log_file}: {e}")
 
         if summary:
-            df_summary = pd.DataFrame(summary)
-            df_summary.sort_values("avg_cpu_percent", inplace=True)
-            print(df_summary.to_string(index=False))
+            summary.sort(key=lambda r: r["avg_cpu_percent"])
+            width = max(len("test"), *(len(r["test"]) for r in summary))
+            print(f"{'test':>{width}}  avg_cpu_percent  max_mem_mb  avg_disk_kbps  video_size_mb")
+            for r in summary:
+                print(f"{r['test']:>{width}}  {r['avg_cpu_percent']:>15.1f}  {r['max_mem_mb']:>10d}"
+                      f"  {r['avg_disk_kbps']:>13.1f}  {r['video_size_mb']:>13.2f}")
         else:
             print("No valid data found in log files.")
     """),
@@ -257,33 +793,41 @@ scripts = {
         echo "========================================="
         echo ""
 
+        {V4L2_FIELD}
+
         # Check system info
         echo "System Information:"
-        echo "- OS: $(cat /etc/os-release | grep PRETTY_NAME | cut -d'=' -f2 | tr -d '\"')"
+        echo "- OS: $( . /etc/os-release; echo "$PRETTY_NAME" )"
         echo "- Kernel: $(uname -r)"
         echo "- Architecture: $(uname -m)"
         echo ""
 
         # Check dependencies
         echo "Dependencies Check:"
-        for cmd in ffmpeg v4l2-ctl iostat; do
-            if command -v "$cmd" &> /dev/null; then
-                echo "OK $cmd: $(which $cmd)"
+        for cmd in ffmpeg v4l2-ctl; do
+            if CMD_PATH=$(command -v "$cmd"); then
+                echo "OK $cmd: $CMD_PATH"
             else
                 echo "X $cmd: NOT FOUND"
             fi
         done
         echo ""
 
-        # Check video devices
+        # Check video devices (an unmatched glob leaves the pattern itself)
+        VIDEO_NODES=(/dev/video*)
+        [ -e "${VIDEO_NODES[0]}" ] || VIDEO_NODES=()
+
         echo "Video Devices:"
-        if ls /dev/video* &>/dev/null; then
-            for dev in /dev/video*; do
+        if [ ${#VIDEO_NODES[@]} -gt 0 ]; then
+            for dev in "${VIDEO_NODES[@]}"; do
                 if [ -c "$dev" ]; then
                     echo "Found: $dev"
-                    if v4l2-ctl -d "$dev" --info &>/dev/null; then
-                        echo "  - Driver: $(v4l2-ctl -d "$dev" --info | grep "Driver name" | cut -d: -f2 | xargs)"
-                        echo "  - Card: $(v4l2-ctl -d "$dev" --info | grep "Card type" | cut -d: -f2 | xargs)"
+                    # One --info call per device; both fields are parsed from it
+                    if DEV_INFO=$(v4l2-ctl -d "$dev" --info 2>/dev/null); then
+                        v4l2_field DRIVER "Driver name" "$DEV_INFO"
+                        v4l2_field CARD "Card type" "$DEV_INFO"
+                        echo "  - Driver: $DRIVER"
+                        echo "  - Card: $CARD"
                     fi
                 fi
             done
@@ -294,7 +838,7 @@ scripts = {
 
         # Check permissions
         echo "Permissions Check:"
-        if groups | grep -q video; then
+        if [[ " $(id -nG) " == *" video "* ]]; then
             echo "OK User is in video group"
         else
             echo "x User NOT in video group - run: sudo usermod -a -G video $$USER"
@@ -312,16 +856,17 @@ scripts = {
 
         # Test simple capture
         echo "Testing simple capture..."
-        if ls /dev/video* &>/dev/null; then
-            TESTDEV=$(ls /dev/video* | head -1)
+        if [ ${#VIDEO_NODES[@]} -gt 0 ]; then
+            TESTDEV=${VIDEO_NODES[0]}
             echo "Testing with $TESTDEV..."
             
-            if timeout 3 ffmpeg -f v4l2 -i "$TESTDEV" -frames:v 1 -f null - &>/dev/null; then
+            # Dequeue a single frame via V4L2 mmap streaming; no ffmpeg startup needed
+            if STREAM_OUTPUT=$(timeout 3 v4l2-ctl -d "$TESTDEV" --stream-mmap=3 --stream-count=1 --stream-to=/dev/null 2>&1); then
                 echo "OK Basic capture test PASSED"
             else
                 echo "X Basic capture test FAILED"
                 echo "Detailed error:"
-                timeout 3 ffmpeg -f v4l2 -i "$TESTDEV" -frames:v 1 -f null - 2>&1 | tail -5
+                tail -5 <<<"$STREAM_OUTPUT"
             fi
         fi
         echo ""
@@ -333,32 +878,47 @@ scripts = {
         echo "3. Try different USB ports"
         echo "4. Update system: sudo apt update && sudo apt upgrade"
         echo "========================================="
-    """)
+    """).replace("{V4L2_FIELD}\n", _V4L2_FIELD),
 }
 
-# Create the script files
-for filename, content in scripts.items():
-    file_path = os.path.join(base_path, filename)
-    with open(file_path, "w", newline='\n', encoding='utf-8') as f:
-        f.write(content)
-    print(f"Created: {file_path}")
-
-# Make shell scripts executable (Unix-style permissions)
-shell_scripts = ["test_video_capture.sh", "monitor_metrics.sh", "diagnose.sh"]
-for script in shell_scripts:
-    script_path = os.path.join(base_path, script)
-    if os.path.exists(script_path):
-        # Add execute permissions for owner, group, and others
-        current_permissions = os.stat(script_path).st_mode
-        os.chmod(script_path, current_permissions | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-        print(f"Made executable: {script_path}")
-
-print(f"\nTest suite created successfully in: {base_path}")
-print("Files created:")
-print("- test_video_capture.sh (main test script)")
-print("- monitor_metrics.sh (system monitoring)")
-print("- summarize_results.py (results analysis)")
-print("- diagnose.sh (diagnostic tool)")
-print("- results/ (output directory)")
-print("\nTo diagnose issues, run: ./diagnose.sh")
-print("To run the tests, execute: ./test_video_capture.sh")
+
+def write_script(file_path, content):
+    """Write content to file_path; anything with a shebang is made executable.
+
+    The mode is passed at creation and re-applied with fchmod, so a file left
+    over from an earlier run is fixed up without a second path lookup.
+    """
+    mode = 0o755 if content.startswith("#!") else 0o644
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    # The buffered file object retries short writes until every byte is out
+    with os.fdopen(fd, "wb") as f:
+        f.write(content.encode('utf-8'))
+        os.fchmod(fd, mode)
+    return file_path
+
+
+def main():
+    # Create results directory if it doesn't exist
+    os.makedirs(results_path, exist_ok=True)
+
+    # The writes are independent, so overlap them; file writes release the GIL
+    with ThreadPoolExecutor(max_workers=len(scripts)) as pool:
+        jobs = [pool.submit(write_script, os.path.join(base_path, name), content)
+                for name, content in scripts.items()]
+        for job in jobs:
+            print(f"Created: {job.result()}")
+
+    print(f"\nTest suite created successfully in: {base_path}")
+    print("Files created:")
+    print("- test_video_capture.sh (main test script)")
+    print("- test_video_capture_parallel.sh (parallel job-queue variant)")
+    print("- monitor_metrics.sh (system monitoring)")
+    print("- summarize_results.py (results analysis)")
+    print("- diagnose.sh (diagnostic tool)")
+    print("- results/ (output directory)")
+    print("\nTo diagnose issues, run: ./diagnose.sh")
+    print("To run the tests, execute: ./test_video_capture.sh")
+
+
+if __name__ == "__main__":
+    main()
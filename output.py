@@ -1,32 +1,58 @@
 html_report_script_fixed = dedent("""\
     import os
     import pandas as pd
-    from glob import glob
 
     result_dir = "./results"
     output_html = os.path.join(result_dir, "summary_report.html")
-    logs = glob(os.path.join(result_dir, "*.log"))
 
-    summary = []
+    # Only the metric columns, with narrow dtypes, so the C parser fast path applies
+    columns = {"cpu_percent": "float32", "mem_used_mb": "int32", "disk_write_kbps": "float32"}
 
-    for log_file in logs:
-        df = pd.read_csv(log_file)
-        avg_cpu = df['cpu_percent'].mean()
-        max_mem = df['mem_used_mb'].max()
-        avg_disk = df['disk_write_kbps'].mean()
+    # One directory pass; DirEntry caches stat() for the video sizes below
+    with os.scandir(result_dir) as it:
+        entries = {e.name: e for e in it}
+    logs = [name for name in entries if name.endswith(".log") and not name.endswith(".error.log")]
 
-        video_file = log_file.replace(".log", ".mp4")
-        size_mb = os.path.getsize(video_file) / (1024 * 1024) if os.path.exists(video_file) else 0
+    if not logs:
+        print(f"No log files found in: {result_dir}")
+        exit(1)
 
-        summary.append({
-            "Test": os.path.basename(log_file).replace(".log", ""),
-            "Avg CPU (%)": round(avg_cpu, 1),
-            "Max RAM (MB)": max_mem,
-            "Avg Disk Write (KB/s)": round(avg_disk, 1),
-            "Video Size (MB)": round(size_mb, 2)
-        })
+    # Read every log, then reduce them all in a single groupby instead of per file
+    frames = {
+        name[:-4]: pd.read_csv(entries[name].path, usecols=list(columns), dtype=columns, engine="c")
+        for name in logs
+    }
+    samples = pd.concat(frames, names=["Test"])
+    summary = samples.groupby(level="Test").agg(**{
+        "Avg CPU (%)": ("cpu_percent", "mean"),
+        "Max RAM (MB)": ("mem_used_mb", "max"),
+        "Avg Disk Write (KB/s)": ("disk_write_kbps", "mean"),
+    })
 
-    df_summary = pd.DataFrame(summary)
+    # A SHARED_CAPTURE log covers every output listed in its .outputs file;
+    # repeat its row once per output, named after that output
+    rows, tests, videos = [], [], []
+    for test in summary.index:
+        outputs = entries.get(test + ".outputs")
+        if outputs is None:
+            rows.append(test)
+            tests.append(test)
+            videos.append(entries.get(test + ".mp4") or entries.get(test + ".mkv"))
+            continue
+        with open(outputs.path) as f:
+            for name in f.read().split():
+                rows.append(test)
+                tests.append(name.rsplit(".", 1)[0] + " (shared)")
+                videos.append(entries.get(name))
+    summary = summary.loc[rows]
+    summary.index = pd.Index(tests, name="Test")
+    summary["Video Size (MB)"] = [v.stat().st_size / (1024 * 1024) if v else 0 for v in videos]
+
+    df_summary = summary.round({
+        "Avg CPU (%)": 1,
+        "Avg Disk Write (KB/s)": 1,
+        "Video Size (MB)": 2,
+    }).reset_index()
     df_summary.sort_values("Avg CPU (%)", inplace=True)
 
     html_table = df_summary.to_html(index=False, border=0, classes="table table-striped")